@@ -5,30 +5,70 @@ This script launches the Twitch Multi-Account Tool application.
 
 import os
 import sys
-import subprocess
+
+# Resolve the path to main.py once at import time; skip the abspath
+# round-trip (and its getcwd call) when __file__ is already absolute
+_SCRIPT = __file__ if os.path.isabs(__file__) else os.path.abspath(__file__)
+MAIN_PY = os.path.join(os.path.dirname(_SCRIPT), "src", "main.py")
+
+def _fail(*messages):
+    """Write error messages to stderr and exit, pausing only for interactive users"""
+    sys.stderr.write("".join(f"{message}\n" for message in messages))
+    if sys.stdin.isatty() and sys.stdout.isatty():
+        input("Press Enter to exit...")
+    sys.exit(1)
+
+def _runnable_main():
+    """Return the script path to hand the child interpreter
+
+    A directly executed script never consults __pycache__, so to skip the
+    parse/compile step the runner has to execute the cached .pyc itself.
+    Compile it if stale and return it; any trouble just falls back to the
+    plain source file.
+    """
+    try:
+        import py_compile
+        from importlib.util import cache_from_source
+
+        cached = cache_from_source(MAIN_PY)
+        source_mtime = os.path.getmtime(MAIN_PY)
+        if not os.path.exists(cached) or os.path.getmtime(cached) < source_mtime:
+            py_compile.compile(MAIN_PY, quiet=2)
+        if os.path.exists(cached):
+            return cached
+    except OSError:
+        pass
+    return MAIN_PY
 
 def main():
     """Main entry point for the runner script"""
-    # Get the directory where this script is located
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    
-    # Path to the main.py file
-    main_py = os.path.join(script_dir, "src", "main.py")
-    
-    if not os.path.exists(main_py):
-        print(f"Error: Could not find {main_py}")
-        print("Please make sure you have the full application downloaded.")
-        input("Press Enter to exit...")
-        return
-    
+    if not os.path.exists(MAIN_PY):
+        # One stat up front: exec/spawn only raise for a missing Python
+        # binary, not a missing script, so without this check the child
+        # just prints "can't open file" and the console closes unread.
+        _fail(f"Error: Could not find {MAIN_PY}",
+              "Please make sure you have the full application downloaded.")
+
+    target = _runnable_main()
+
     try:
-        # Execute the main.py file
-        subprocess.run([sys.executable, main_py], check=True)
-    except KeyboardInterrupt:
-        print("\nApplication terminated by user.")
-    except Exception as e:
-        print(f"Error running the application: {e}")
-        input("Press Enter to exit...")
+        if os.name == "nt":
+            # exec on Windows leaves the console detached from the new
+            # process, so spawn a child there. Absolute paths and default
+            # fd handling keep subprocess on its fast spawn path.
+            import subprocess
+            try:
+                completed = subprocess.run([sys.executable, target], close_fds=True)
+            except KeyboardInterrupt:
+                sys.exit(130)
+            sys.exit(completed.returncode)
+        else:
+            # Replace this process with main.py instead of running a second
+            # one. main.py installs its own signal handlers and calls
+            # sys.exit, so it should own the process outright.
+            os.execv(sys.executable, [sys.executable, target])
+    except OSError as e:
+        _fail(f"Error running the application: {e}")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
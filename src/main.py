@@ -1,26 +1,144 @@
+import array
+import asyncio
+import ctypes
+import math
 import subprocess
 import time
 import pygetwindow as gw
 import psutil
 import threading
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
+import logging
+import logging.handlers
 import sys
 import signal
 import platform
 import datetime
+import functools
 import uuid
+from dataclasses import dataclass, asdict, fields
 from pathlib import Path
 from screeninfo import get_monitors
+
+try:
+    import orjson  # Optional: much faster JSON encode/decode
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    """Decode JSON from bytes/str, preferring orjson when installed"""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _json_dumps(obj):
+    """Encode to indented JSON bytes, preferring orjson when installed"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def _write_json_atomic(path, obj):
+    """Write JSON via temp file + rename so a crash never leaves a torn file
+
+    One buffered write of the full serialized payload, fsynced, then an
+    atomic os.replace over the target.
+    """
+    data = _json_dumps(obj)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+# Process names that count as Chrome when scanning the process table
+_CHROME_NAMES = frozenset({"chrome", "chrome.exe", "google chrome", "chromium"})
+
+# Per-window launch/recovery events go to a rotating file log; the console
+# gets one summary line per batch so Rich isn't re-rendering per event
+_log = logging.getLogger("twitch_launcher")
+if not _log.handlers:
+    _log_handler = logging.handlers.RotatingFileHandler(
+        "twitch_launcher.log", maxBytes=512 * 1024, backupCount=2, delay=True)
+    _log_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    _log.addHandler(_log_handler)
+    _log.setLevel(logging.INFO)
+
+# Platform details never change at runtime, so resolve them once at import
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+_CHROME_USER_DATA_DIR = {
+    "Windows": os.path.expanduser("~\\AppData\\Local\\Google\\Chrome\\User Data"),
+    "Darwin": os.path.expanduser("~/Library/Application Support/Google/Chrome"),
+}.get(_SYSTEM, os.path.expanduser("~/.config/google-chrome"))
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if _SYSTEM == "Linux" else 4096
+
+def _grid(n):
+    """Near-square grid shape (cols, rows) for n windows"""
+    cols = max(1, math.isqrt(n))
+    if cols * cols < n:
+        cols += 1
+    return cols, max(1, (n + cols - 1) // cols)
+
+# Window counts are small in practice, so precompute the whole realistic
+# range once; the prompt paths get a dict hit instead of an isqrt each
+_GRID_BY_N = {n: _grid(n) for n in range(1, 257)}
+
+def _parse_int(s):
+    """Parse prompt input to an int, or None if it isn't one
+
+    A decimal pre-check keeps typos off the exception path; building a
+    ValueError plus traceback costs far more than the scan. isdecimal
+    (not isdigit) so characters like a superscript 3, which int()
+    rejects, don't slip through.
+    """
+    s = s.strip()
+    return int(s) if s.removeprefix("-").isdecimal() else None
+
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
 from rich.progress import Progress
-from rich.columns import Columns
-from rich.markdown import Markdown
+from rich.live import Live
+from rich.text import Text
+
+@dataclass(slots=True)
+class Settings:
+    """Fixed schema for settings.json
+
+    A slotted dataclass instead of a free-form dict: attribute access is
+    monomorphic for the interpreter, instances carry no per-object dict,
+    and typos fail loudly instead of silently adding keys.
+    """
+    num_windows: int = 4
+    streamer: str = ""
+    quality: str = "auto"
+    memory_limit_per_process: int | None = None
+    gpu_mode: str = "gpu"  # "gpu" keeps Chrome's GPU compositing; "cpu" forces it off
+    current_profile_id: str | None = None
+    active_layout: str | None = None
+
+
+# Known settings keys, for filtering stale entries out of old files
+_SETTINGS_FIELDS = frozenset(f.name for f in fields(Settings))
+
 
 class TwitchLauncher:
+    # Stream quality choices and their Twitch URL parameters; shared by
+    # every prompt and URL builder instead of being rebuilt per call
+    _QUALITY_OPTIONS = ("auto", "source", "720p", "480p", "360p", "160p")
+    _QUALITY_MAP = {
+        "source": "chunked",
+        "720p": "720p60",
+        "480p": "480p30",
+        "360p": "360p30",
+        "160p": "160p30"
+    }
+
     def __init__(self):
         self.console = Console()
         self.settings_file = Path("settings.json")
@@ -28,31 +146,65 @@ class TwitchLauncher:
         self.processes = []
         self.windows = []
         self.running = True
-        self.network_thread = None
+        self._background_thread = None  # Hosts the asyncio monitor loop
+        self._background_loop = None  # The loop itself, for cross-thread task submission
+        self._monitor_gather = None  # Gathered monitor coroutines; cancelled on shutdown
+        self._loop_ready = threading.Event()  # Set once the loop is running
+        self._chrome_procs = {}  # pid -> psutil.Process for launched Chrome windows
+        self._statm_fds = {}  # pid -> cached /proc/<pid>/statm fd (Linux only)
+        self._chrome_scan_cache = (0.0, [])  # (timestamp, procs) fallback scan cache
+
+        # Shared single-line status display fed by the monitor threads;
+        # one Live region avoids re-rendering markup per tick and stops
+        # the threads overwriting each other with end="\r" prints
+        self._status_lock = threading.Lock()
+        self._status = {}
+        self._status_live = None
         self.num_windows = 0
         self.streamer = ""
         self.url = ""
+
         self.chrome_path = self._find_chrome_path()
         self.quality = "auto"  # Default quality setting
         self.memory_limit_per_process = None  # Memory limit in MB
+        self.gpu_mode = "gpu"  # GPU compositing on unless the user opts out
+        self._argv_base_cache = None  # (flags, argv prefix) for Chrome launches
+        self._last_saved_state = None  # Snapshot of the last profile-activation save
+
+        # In-memory settings cache (avoids re-reading settings.json per call)
+        self._settings_cache = None
+        self._settings_mtime = None
+        self._settings_dirty = False  # Deferred settings write pending a flush
         
         # Watch time tracking
-        self.watch_start_times = {}  # Dictionary to track start time for each window
-        self.watch_time_thread = None  # Thread for tracking watch time
+        self.watch_start_times = array.array('d')  # Packed per-window start timestamps
+        self.watch_time_task = None  # Watch-time coroutine on the background loop
         self.total_session_time = 0  # Total time for the whole session
         self.session_start_time = None
         
         # Profile management
         self.profiles = {}  # Dictionary to store profiles
+        self._profile_order = []  # Display order from the last show_profiles render
+        self._profile_cache = {}  # path -> (mtime, parsed) profile-file cache
         self.current_profile = None  # Currently active profile
         
         # Window state tracking (for crash recovery)
         self.window_states = {}  # Track state of each window
-        self.crash_recovery_thread = None  # Thread for monitoring crashes
+        self._window_index = {}  # profile -> window handle, see _refresh_window_index
+        self.crash_recovery_task = None  # Crash-monitor coroutine on the background loop
         
         # Multiple monitor layout support
         self.monitor_layouts = {}  # Custom layouts for multiple monitors
+        self.monitors_index = []  # Shared monitor table; layouts store an index into it
+        self._monitor_keys = {}  # (width, height, x, y) -> index in monitors_index
+        self.layouts_file = self.profiles_dir / "layouts.json"  # Single file for all layouts
+        self._layouts_dirty = False  # Unsaved layout edits pending a flush
+        self._layout_order = []  # Layout ids in display order, for number selection
+        self._layouts_table_cache = None  # (signature, Table) from the last render
         self.active_layout = None  # Currently active layout
+        self._layout_cache = {}  # (num_windows, monitor sig) -> [(x, y, w, h), ...]
+        self._monitors = None  # Cached monitor list from get_screen_resolution
+        self._monitors_ts = 0.0  # monotonic timestamp of the last detection
         
         # Set up signal handlers for clean exit
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -62,7 +214,10 @@ class TwitchLauncher:
         if not self.profiles_dir.exists():
             self.profiles_dir.mkdir(exist_ok=True)
         
-        # Load profiles
+        # Load layouts before profiles: layout migration deletes any
+        # legacy layout_<id>.json files, which carry the id/name keys the
+        # profile scan validates on and would otherwise load as profiles
+        self.load_monitor_layouts()
         self.load_all_profiles()
 
     def _signal_handler(self, sig, frame):
@@ -74,7 +229,7 @@ class TwitchLauncher:
 
     def _find_chrome_path(self):
         """Find Chrome executable path based on operating system"""
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             paths = [
                 r"C:\Program Files\Google\Chrome\Application\chrome.exe",
                 r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
@@ -83,9 +238,9 @@ class TwitchLauncher:
             for path in paths:
                 if os.path.exists(path):
                     return path
-        elif platform.system() == "Darwin":  # macOS
+        elif _SYSTEM == "Darwin":  # macOS
             return "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
-        elif platform.system() == "Linux":
+        elif _SYSTEM == "Linux":
             for path in ["/usr/bin/google-chrome", "/usr/bin/chrome", "/usr/bin/chromium"]:
                 if os.path.exists(path):
                     return path
@@ -94,51 +249,64 @@ class TwitchLauncher:
         return None
 
     def load_settings(self):
-        """Load last used settings from file"""
+        """Load last used settings from file (cached until the file changes)"""
         if self.settings_file.exists():
             try:
-                with open(self.settings_file, "r") as f:
-                    settings = json.load(f)
-                    
-                    # Load current profile if specified
-                    if "current_profile_id" in settings and settings["current_profile_id"] in self.profiles:
-                        self.current_profile = settings["current_profile_id"]
-                    
-                    # Load active layout if specified
-                    if "active_layout" in settings:
-                        self.active_layout = settings["active_layout"]
-                        
-                    return settings
-            except json.JSONDecodeError:
+                mtime = os.stat(self.settings_file).st_mtime
+                if self._settings_cache is not None and mtime == self._settings_mtime:
+                    settings = self._settings_cache
+                else:
+                    with open(self.settings_file, "rb") as f:
+                        data = f.read()
+                    raw = orjson.loads(data) if orjson else json.loads(data)
+                    settings = Settings(**{k: v for k, v in raw.items() if k in _SETTINGS_FIELDS})
+                    self._settings_cache = settings
+                    self._settings_mtime = mtime
+
+                # Load current profile if specified
+                if settings.current_profile_id in self.profiles:
+                    self.current_profile = settings.current_profile_id
+
+                # Load active layout if specified
+                if settings.active_layout:
+                    self.active_layout = settings.active_layout
+
+                return settings
+            except (ValueError, TypeError, AttributeError):
                 self.console.print("[bold red]Error reading settings file. Using defaults.[/bold red]")
-        return {
-            "num_windows": 4, 
-            "streamer": "", 
-            "quality": "auto", 
-            "memory_limit_per_process": None
-        }
+        return Settings()
 
     def save_settings(self):
         """Save current settings to file"""
         try:
-            settings = {
-                "num_windows": self.num_windows,
-                "streamer": self.streamer,
-                "quality": self.quality,
-                "memory_limit_per_process": self.memory_limit_per_process
-            }
-            
-            # Save current profile if one is active
-            if self.current_profile:
-                settings["current_profile_id"] = self.current_profile
-                
-            # Save active layout if one is active
-            if self.active_layout:
-                settings["active_layout"] = self.active_layout
-                
-            with open(self.settings_file, "w") as f:
-                json.dump(settings, f, indent=2)
+            settings = Settings(
+                num_windows=self.num_windows,
+                streamer=self.streamer,
+                quality=self.quality,
+                memory_limit_per_process=self.memory_limit_per_process,
+                gpu_mode=self.gpu_mode,
+                current_profile_id=self.current_profile or None,
+                active_layout=self.active_layout or None,
+            )
+            payload = asdict(settings)
+
+            if orjson:
+                # Skip indentation on the hot save path; orjson writes bytes
+                with open(self.settings_file, "wb") as f:
+                    f.write(orjson.dumps(payload))
+            else:
+                with open(self.settings_file, "w") as f:
+                    json.dump(payload, f, indent=2)
+
+            # Keep the in-memory cache in sync with what was just written,
+            # and snapshot the saved values here so every save path keeps
+            # the profile-activation skip honest
+            self._settings_cache = settings
+            self._settings_mtime = os.stat(self.settings_file).st_mtime
+            self._last_saved_state = (settings.num_windows, settings.streamer,
+                                      settings.quality, settings.current_profile_id)
         except Exception as e:
+            self._last_saved_state = None
             self.console.print(f"[bold red]Error saving settings: {e}[/bold red]")
 
     def export_settings(self, filepath=None):
@@ -154,12 +322,17 @@ class TwitchLauncher:
                 "num_windows": self.num_windows,
                 "streamer": self.streamer,
                 "quality": self.quality,
-                "memory_limit_per_process": self.memory_limit_per_process
+                "memory_limit_per_process": self.memory_limit_per_process,
+                "gpu_mode": self.gpu_mode
             }
-            
-            with open(filepath, "w") as f:
-                json.dump(settings, f, indent=2)
-                
+
+            if orjson:
+                with open(filepath, "wb") as f:
+                    f.write(orjson.dumps(settings, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filepath, "w") as f:
+                    json.dump(settings, f, indent=2)
+
             self.console.print(f"[bold green]✅ Settings exported successfully to {filepath}[/bold green]")
         except Exception as e:
             self.console.print(f"[bold red]Error exporting settings: {e}[/bold red]")
@@ -177,8 +350,9 @@ class TwitchLauncher:
                 self.console.print(f"[bold red]Settings file not found: {filepath}[/bold red]")
                 return False
                 
-            with open(filepath, "r") as f:
-                settings = json.load(f)
+            with open(filepath, "rb") as f:
+                data = f.read()
+            settings = orjson.loads(data) if orjson else json.loads(data)
             
             # Update settings with validation
             if "num_windows" in settings and isinstance(settings["num_windows"], int) and settings["num_windows"] > 0:
@@ -188,12 +362,16 @@ class TwitchLauncher:
                 self.streamer = settings["streamer"]
                 self.url = f"https://www.twitch.tv/{self.streamer}" if self.streamer else "https://www.twitch.tv"
             
-            if "quality" in settings and settings["quality"] in ["auto", "source", "720p", "480p", "360p", "160p"]:
+            if "quality" in settings and settings["quality"] in self._QUALITY_OPTIONS:
                 self.quality = settings["quality"]
                 
             if "memory_limit_per_process" in settings:
                 self.memory_limit_per_process = settings["memory_limit_per_process"]
-            
+
+            if settings.get("gpu_mode") in ("gpu", "cpu"):
+                self.gpu_mode = settings["gpu_mode"]
+
+
             # Save to the default settings file
             self.save_settings()
             self.console.print(f"[bold green]✅ Settings imported successfully from {filepath}[/bold green]")
@@ -205,54 +383,66 @@ class TwitchLauncher:
             self.console.print(f"[bold red]Error importing settings: {e}[/bold red]")
             return False
 
+    # Monitor detection hits the OS; reuse a recent result for the bursts
+    # of calls one menu interaction produces, but expire it quickly enough
+    # that a plugged/unplugged monitor is picked up on the next prompt.
+    _MONITOR_CACHE_TTL = 2.0
+
     def get_screen_resolution(self):
-        """Get all available monitors"""
+        """Get all available monitors (cached briefly; see _MONITOR_CACHE_TTL)"""
+        if self._monitors is not None and time.monotonic() - self._monitors_ts < self._MONITOR_CACHE_TTL:
+            return self._monitors
+
         try:
             monitors = get_monitors()
             if not monitors:
                 self.console.print("[bold yellow]Warning: No monitors detected. Using default resolution.[/bold yellow]")
-                return [{"width": 1920, "height": 1080, "x": 0, "y": 0}]
-            
-            return [{"width": m.width, "height": m.height, "x": m.x, "y": m.y} for m in monitors]
+                self._monitors = [{"width": 1920, "height": 1080, "x": 0, "y": 0}]
+            else:
+                self._monitors = [{"width": m.width, "height": m.height, "x": m.x, "y": m.y} for m in monitors]
         except Exception as e:
             self.console.print(f"[bold red]Error detecting monitors: {e}. Using default resolution.[/bold red]")
-            return [{"width": 1920, "height": 1080, "x": 0, "y": 0}]
+            self._monitors = [{"width": 1920, "height": 1080, "x": 0, "y": 0}]
+
+        self._monitors_ts = time.monotonic()
+        return self._monitors
+
+    def refresh_monitors(self):
+        """Drop the cached monitor list and re-detect the displays
+
+        The TTL already expires the cache on its own; this is the explicit
+        path for when the user wants the new monitor set right now.
+        """
+        self._monitors = None
+        self._monitors_ts = 0.0
+        monitors = self.get_screen_resolution()
+        self.console.print(f"[bold green]✅ Detected {len(monitors)} monitor(s).[/bold green]")
 
     def validate_chrome_profiles(self, profiles):
         """Get only valid existing Chrome profiles"""
-        valid_profiles = []
-        missing_profiles = []
-        
-        if platform.system() == "Windows":
-            chrome_profile_dir = os.path.expanduser("~\\AppData\\Local\\Google\\Chrome\\User Data")
-        elif platform.system() == "Darwin":  # macOS
-            chrome_profile_dir = os.path.expanduser("~/Library/Application Support/Google/Chrome")
-        else:  # Linux
-            chrome_profile_dir = os.path.expanduser("~/.config/google-chrome")
-        
+        chrome_profile_dir = _CHROME_USER_DATA_DIR
+
         if not os.path.exists(chrome_profile_dir):
             self.console.print(f"[bold red]Chrome profile directory not found at {chrome_profile_dir}[/bold red]")
             self.console.print("[bold yellow]Please make sure Chrome is installed and has been run at least once.[/bold yellow]")
             return []
             
-        # List existing profiles to provide info
-        existing_profiles = []
+        # One scandir pass covers both the membership check and the list
+        # of known profile directories; entry.is_dir() works off cached
+        # dirent data, so no per-entry stat calls
         try:
-            for item in os.listdir(chrome_profile_dir):
-                item_path = os.path.join(chrome_profile_dir, item)
-                if os.path.isdir(item_path) and (item.startswith("Profile ") or item == "Default" or item.startswith("Twich ")):
-                    existing_profiles.append(item)
-        except Exception as e:
+            with os.scandir(chrome_profile_dir) as entries:
+                existing_names = {entry.name for entry in entries if entry.is_dir()}
+        except OSError as e:
             self.console.print(f"[bold red]Error listing Chrome profiles: {e}[/bold red]")
-            
-        # Check if each profile exists and only use existing ones
-        for profile in profiles:
-            profile_path = os.path.join(chrome_profile_dir, profile)
-            if os.path.exists(profile_path):
-                valid_profiles.append(profile)
-            else:
-                missing_profiles.append(profile)
-        
+            existing_names = set()
+
+        # Everything below is pure in-memory set membership on that one read
+        existing_profiles = sorted(name for name in existing_names
+                                   if name.startswith(("Profile ", "Twich ")) or name == "Default")
+        valid_profiles = [profile for profile in profiles if profile in existing_names]
+        missing_profiles = [profile for profile in profiles if profile not in existing_names]
+
         # Show missing profiles if any
         if missing_profiles:
             self.console.print("\n[bold yellow]---------------------------- MISSING PROFILES ----------------------------[/bold yellow]")
@@ -262,7 +452,7 @@ class TwitchLauncher:
             
             self.console.print("\n[bold cyan]Existing profiles:[/bold cyan]")
             if existing_profiles:
-                for profile in sorted(existing_profiles):
+                for profile in existing_profiles:
                     self.console.print(f"  • [green]{profile}[/green]")
             else:
                 self.console.print("  [yellow]No custom profiles found[/yellow]")
@@ -288,35 +478,254 @@ class TwitchLauncher:
         # For simplicity, we'll use the first monitor for all windows
         monitor = monitors[0]
         screen_width, screen_height = monitor["width"], monitor["height"]
-        
-        # Calculate grid dimensions
-        cols = max(1, round(num_windows ** 0.5))
-        rows = max(1, (num_windows + cols - 1) // cols)
+
+        # Grid shapes for the realistic window range are precomputed at
+        # import; only absurd counts fall through to the integer math
+        cols, rows = _GRID_BY_N.get(num_windows) or _grid(num_windows)
         win_width = screen_width // cols
         win_height = screen_height // rows
-        
+
         return cols, rows, win_width, win_height, monitor["x"], monitor["y"]
 
-    def monitor_network(self):
-        """Monitor network usage in a separate thread"""
-        old_recv = psutil.net_io_counters().bytes_recv
-        old_sent = psutil.net_io_counters().bytes_sent
+    def _find_chrome_windows(self):
+        """Enumerate Chrome top-level windows
+
+        On Windows, gw.getWindowsWithTitle('') walks every top-level
+        window and each w.title access is a fresh GetWindowTextW call.
+        Filtering by Chrome's window class via EnumWindows needs one
+        GetClassNameW per window and no title reads at all.
+        """
+        if _IS_WINDOWS:
+            user32 = ctypes.windll.user32
+            hwnds = []
+            buf = ctypes.create_unicode_buffer(64)
+
+            @ctypes.WINFUNCTYPE(ctypes.c_bool, ctypes.c_void_p, ctypes.c_void_p)
+            def collect(hwnd, lparam):
+                if user32.IsWindowVisible(hwnd):
+                    user32.GetClassNameW(hwnd, buf, 64)
+                    if buf.value == "Chrome_WidgetWin_1":
+                        hwnds.append(hwnd)
+                return True
+
+            user32.EnumWindows(collect, 0)
+            return [gw.Win32Window(hwnd) for hwnd in hwnds]
+
+        # Elsewhere fall back to the title scan, reading each title once
+        return [w for w in gw.getWindowsWithTitle('')
+                if 'Twitch' in w.title or 'Chrome' in w.title]
+
+    def _refresh_window_index(self):
+        """Rebuild the profile -> window map with one enumeration pass
+
+        Crash monitoring consults this dict instead of rescanning OS
+        windows per tracked state; each window title is read exactly once
+        per rebuild.
+        """
+        profiles = {state["profile"] for state in self.window_states.values()}
+        index = {}
+        if profiles:
+            for win in self._find_chrome_windows():
+                title = win.title or ""
+                for profile in profiles:
+                    if profile in title:
+                        index.setdefault(profile, win)
+        self._window_index = index
+
+    def _grid_positions(self, num_windows, monitors):
+        """Return cached (x, y, w, h) placements for the default grid"""
+        monitor = monitors[0]
+        key = (num_windows, monitor["width"], monitor["height"], monitor["x"], monitor["y"])
+        positions = self._layout_cache.get(key)
+        if positions is None:
+            cols, rows, win_width, win_height, offset_x, offset_y = self.calculate_grid(num_windows, monitors)
+            # Closed form: window i sits at column i % cols, row i // cols;
+            # no wrap branch in the loop
+            positions = [(offset_x + (i % cols) * win_width,
+                          offset_y + (i // cols) * win_height,
+                          win_width, win_height)
+                         for i in range(num_windows)]
+            self._layout_cache[key] = positions
+        return positions
+
+    async def monitor_network(self):
+        """Monitor network usage on the background event loop"""
+        counters = psutil.net_io_counters()
+        old_recv, old_sent = counters.bytes_recv, counters.bytes_sent
         update_interval = 2  # seconds
-        
+
         while self.running:
-            time.sleep(update_interval)
+            await asyncio.sleep(update_interval)
             try:
-                new_recv = psutil.net_io_counters().bytes_recv
-                new_sent = psutil.net_io_counters().bytes_sent
-                
+                counters = psutil.net_io_counters()
+                new_recv, new_sent = counters.bytes_recv, counters.bytes_sent
+
                 download_speed = (new_recv - old_recv) / 1024 / update_interval
                 upload_speed = (new_sent - old_sent) / 1024 / update_interval
                 
                 old_recv, old_sent = new_recv, new_sent
                 
-                self.console.print(f"[cyan]\\[📶] Download: {download_speed:.2f} KB/s | [🚀] Upload: {upload_speed:.2f} KB/s[/cyan]", end="\r")
+                self._update_status("network", f"[cyan]\\[📶] Download: {download_speed:.2f} KB/s \\[🚀] Upload: {upload_speed:.2f} KB/s[/cyan]")
+            except Exception as e:
+                self._update_status("network", f"[bold red]Network monitoring error: {e}[/bold red]")
+
+    def _update_status(self, key, markup):
+        """Publish one monitor's line into the shared status display"""
+        with self._status_lock:
+            self._status[key] = markup
+            if self._status_live is None:
+                self._status_live = Live("", console=self.console, auto_refresh=False, transient=True)
+                self._status_live.start()
+            self._status_live.update(Text.from_markup(" | ".join(self._status.values())))
+            self._status_live.refresh()
+
+    def _register_chrome_process(self, process):
+        """Keep a psutil handle for a launched Chrome process for monitoring"""
+        try:
+            proc = psutil.Process(process.pid)
+            # Prime the CPU counter; the first cpu_percent call always
+            # returns 0.0, after which interval-free calls return the
+            # usage since the previous call without blocking
+            proc.cpu_percent(None)
+            self._chrome_procs[process.pid] = proc
+        except psutil.NoSuchProcess:
+            return
+        if _SYSTEM == "Linux":
+            # Keep /proc/<pid>/statm open so each memory poll is a single
+            # pread instead of psutil's open/read/close round trip
+            try:
+                self._statm_fds[process.pid] = os.open(f"/proc/{process.pid}/statm", os.O_RDONLY)
+            except OSError:
+                pass
+
+    def _drop_chrome_process(self, pid):
+        """Forget a Chrome process: psutil handle and any cached statm descriptor"""
+        self._chrome_procs.pop(pid, None)
+        fd = self._statm_fds.pop(pid, None)
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def _proc_rss(self, pid):
+        """Read a process's resident set size from its cached statm descriptor
+
+        Returns None when no descriptor is cached (non-Linux, or the open
+        failed), in which case the caller falls back to psutil.
+        """
+        fd = self._statm_fds.get(pid)
+        if fd is None:
+            return None
+        buf = os.pread(fd, 128, 0)
+        return int(buf.split()[1]) * _PAGE_SIZE
+
+    def _iter_chrome_procs(self):
+        """Return Chrome processes, preferring the launched-process cache
+
+        Falls back to a short-lived cached process-table scan when no
+        launched processes are tracked (e.g. Chrome windows opened
+        outside this tool), so back-to-back callers within the cache
+        window share one scan.
+        """
+        if self._chrome_procs:
+            return list(self._chrome_procs.values())
+
+        now = time.monotonic()
+        scanned_at, procs = self._chrome_scan_cache
+        if now - scanned_at < 2:
+            return procs
+
+        procs = []
+        for proc in psutil.process_iter(['pid', 'name']):
+            name = proc.info['name']
+            if name and name.casefold() in _CHROME_NAMES:
+                procs.append(proc)
+        self._chrome_scan_cache = (now, procs)
+        return procs
+
+    def optimize_processes(self):
+        """Lower the priority of Chrome processes to keep the system responsive"""
+        def lower_priority(proc):
+            try:
+                if _IS_WINDOWS:
+                    proc.nice(psutil.BELOW_NORMAL_PRIORITY_CLASS)
+                else:
+                    # Direct syscall; skips psutil's nice() wrapper
+                    os.setpriority(os.PRIO_PROCESS, proc.pid, 10)
+                return True
+            except (psutil.NoSuchProcess, psutil.AccessDenied, OSError):
+                return False
+
+        # Each priority change is a blocking call, so batch them in parallel
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            optimized = sum(executor.map(lower_priority, self._iter_chrome_procs()))
+
+        self.console.print(f"[bold green]✅ Lowered priority of {optimized} Chrome processes![/bold green]")
+
+    def _start_background_monitors(self):
+        """Run the monitor coroutines on a single background event loop
+
+        One thread hosting an asyncio loop replaces one OS thread per
+        monitor; the coroutines share its wakeups instead of contending
+        on the GIL when their sleeps expire together. Watch-time and
+        crash-recovery tasks are submitted onto the same loop later via
+        _submit_background.
+        """
+        if self._background_thread and self._background_thread.is_alive():
+            return
+
+        async def gather_monitors():
+            self._background_loop = asyncio.get_running_loop()
+            self._monitor_gather = asyncio.gather(self.monitor_network(), self.monitor_cpu_memory())
+            self._loop_ready.set()
+            try:
+                await self._monitor_gather
+            except asyncio.CancelledError:
+                # cleanup cancels the gather to end the loop immediately
+                pass
+
+        self._loop_ready.clear()
+        self._background_thread = threading.Thread(
+            target=lambda: asyncio.run(gather_monitors()), daemon=True)
+        self._background_thread.start()
+
+    def _submit_background(self, coro):
+        """Schedule a coroutine onto the shared background event loop"""
+        self._start_background_monitors()
+        self._loop_ready.wait(timeout=5)
+        return asyncio.run_coroutine_threadsafe(coro, self._background_loop)
+
+    async def monitor_cpu_memory(self):
+        """Monitor memory usage of launched Chrome processes on the background event loop"""
+        update_interval = 5  # seconds
+
+        while self.running:
+            await asyncio.sleep(update_interval)
+            try:
+                total_memory = 0
+                total_cpu = 0.0
+                sampled = 0
+                for proc in self._iter_chrome_procs():
+                    try:
+                        # Prefer the cached statm descriptor (one pread on
+                        # Linux); psutil covers the other platforms
+                        rss = self._proc_rss(proc.pid)
+                        with proc.oneshot():
+                            if rss is None:
+                                rss = proc.memory_info().rss
+                            # Interval-free: returns usage since the last
+                            # call instead of blocking the thread to sample
+                            total_cpu += proc.cpu_percent(None)
+                        total_memory += rss
+                        sampled += 1
+                    except (psutil.NoSuchProcess, OSError, ValueError):
+                        self._drop_chrome_process(proc.pid)
+
+                if sampled:
+                    self._update_status("resources", f"[magenta]\\[🧠] Chrome memory: {total_memory / 1024 / 1024:.0f} MB, CPU: {total_cpu:.1f}% ({sampled} processes)[/magenta]")
             except Exception as e:
-                self.console.print(f"[bold red]Network monitoring error: {e}[/bold red]", end="\r")
+                self._update_status("resources", f"[bold red]Resource monitoring error: {e}[/bold red]")
 
     def get_user_input(self):
         """Get and validate user input"""
@@ -324,31 +733,34 @@ class TwitchLauncher:
         
         # Get number of windows
         while True:
-            try:
-                self.num_windows = int(Prompt.ask(
-                    "[bold yellow]How many windows do you want to open?[/bold yellow]", 
-                    default=str(last_settings["num_windows"])
-                ))
-                
-                if self.num_windows <= 0:
-                    self.console.print("[bold red]Number of windows must be positive.[/bold red]")
-                    continue
-                    
-                if self.num_windows > 20:
-                    if not Confirm.ask("[bold red]Opening more than 20 windows may cause performance issues. Continue?[/bold red]"):
-                        continue
-                break
-            except ValueError:
+            num_windows = _parse_int(Prompt.ask(
+                "[bold yellow]How many windows do you want to open?[/bold yellow]",
+                default=str(last_settings.num_windows)
+            ))
+
+            if num_windows is None:
                 self.console.print("[bold red]Please enter a valid number.[/bold red]")
+                continue
+
+            if num_windows <= 0:
+                self.console.print("[bold red]Number of windows must be positive.[/bold red]")
+                continue
+
+            if num_windows > 20:
+                if not Confirm.ask("[bold red]Opening more than 20 windows may cause performance issues. Continue?[/bold red]"):
+                    continue
+
+            self.num_windows = num_windows
+            break
         
         # Get streamer name
         self.streamer = Prompt.ask(
             "[bold yellow]Enter a streamer name or leave blank for the Twitch homepage[/bold yellow]",
-            default=last_settings["streamer"]
+            default=last_settings.streamer
         ).strip()
         
         # Get stream quality
-        quality_options = ["auto", "source", "720p", "480p", "360p", "160p"]
+        quality_options = self._QUALITY_OPTIONS
         self.console.print("[bold yellow]Available quality options:[/bold yellow]")
         for i, quality in enumerate(quality_options, 1):
             self.console.print(f"  {i}. {quality}")
@@ -356,11 +768,11 @@ class TwitchLauncher:
         while True:
             quality_choice = Prompt.ask(
                 "[bold yellow]Select stream quality[/bold yellow]",
-                default=last_settings.get("quality", "auto")
+                default=last_settings.quality
             )
             
             # Handle both number input and direct quality name
-            if quality_choice.isdigit() and 1 <= int(quality_choice) <= len(quality_options):
+            if quality_choice.isdecimal() and 1 <= int(quality_choice) <= len(quality_options):
                 self.quality = quality_options[int(quality_choice) - 1]
                 break
             elif quality_choice in quality_options:
@@ -372,46 +784,47 @@ class TwitchLauncher:
         # Get memory limit per process (optional)
         memory_limit_str = Prompt.ask(
             "[bold yellow]Set memory limit per Chrome process (MB, leave blank for no limit)[/bold yellow]",
-            default="" if last_settings.get("memory_limit_per_process") is None else str(last_settings.get("memory_limit_per_process"))
+            default="" if last_settings.memory_limit_per_process is None else str(last_settings.memory_limit_per_process)
         )
         
         if memory_limit_str.strip():
-            try:
-                self.memory_limit_per_process = int(memory_limit_str)
-                if self.memory_limit_per_process <= 0:
-                    self.console.print("[bold red]Invalid memory limit. No limit will be applied.[/bold red]")
-                    self.memory_limit_per_process = None
-            except ValueError:
+            memory_limit = _parse_int(memory_limit_str)
+            if memory_limit is None or memory_limit <= 0:
                 self.console.print("[bold red]Invalid memory limit. No limit will be applied.[/bold red]")
-                self.memory_limit_per_process = None
+                memory_limit = None
+            self.memory_limit_per_process = memory_limit
         else:
             self.memory_limit_per_process = None
+
+        # Get rendering mode
+        self.gpu_mode = Prompt.ask(
+            "[bold yellow]Rendering mode ('gpu' recommended; 'cpu' disables GPU compositing)[/bold yellow]",
+            choices=["gpu", "cpu"],
+            default=last_settings.gpu_mode if last_settings.gpu_mode in ("gpu", "cpu") else "gpu"
+        )
         
         self.url = f"https://www.twitch.tv/{self.streamer}" if self.streamer else "https://www.twitch.tv"
         
         # Save settings
         self.save_settings()
 
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _build_quality_url(streamer, quality):
+        """Build the launch URL for a streamer/quality pair
+
+        Pure on its arguments, so lru_cache keeps every recently used
+        combination across streamer and quality switches.
+        """
+        url = f"https://www.twitch.tv/{streamer}" if streamer else "https://www.twitch.tv"
+        if quality == "auto" or not streamer:  # No quality param for the homepage
+            return url
+        quality_param = TwitchLauncher._QUALITY_MAP.get(quality, "chunked")  # Default to source if invalid
+        return f"{url}?quality={quality_param}"
+
     def get_quality_url_parameter(self):
         """Generate URL parameter for stream quality"""
-        if self.quality == "auto" or not self.streamer:  # Don't use quality param for the homepage
-            return self.url
-            
-        # Map quality to Twitch URL parameter
-        quality_map = {
-            "source": "chunked",
-            "720p": "720p60",
-            "480p": "480p30",
-            "360p": "360p30",
-            "160p": "160p30"
-        }
-        
-        quality_param = quality_map.get(self.quality, "chunked")  # Default to source if invalid
-        
-        # Use different URL formats depending on whether we're on a specific channel or the homepage
-        if self.streamer:
-            return f"{self.url}?quality={quality_param}"
-        return self.url
+        return self._build_quality_url(self.streamer, self.quality)
 
     def launch_chrome_windows(self):
         """Launch Chrome windows with different profiles"""
@@ -435,47 +848,108 @@ class TwitchLauncher:
         
         # Validate profiles exist
         chrome_profiles = self.validate_chrome_profiles(chrome_profiles)
-        
-        # Chrome parameters
-        chrome_params = [
-            "--disable-plugins",
-            "--disable-software-rasterizer",
-            "--disable-gpu-compositing"
-        ]
-        
-        # Add memory limit if specified
-        if self.memory_limit_per_process:
-            chrome_params.append(f"--js-flags=--max-old-space-size={self.memory_limit_per_process}")
-        
-        # Launch Chrome with different profiles
+
+        # Launch Chrome with all profiles concurrently; Chrome starts up
+        # independently per profile, so there is no need to gate launches
+        # behind each other
         with Progress() as progress:
             task = progress.add_task("[cyan]Launching Chrome windows...", total=len(chrome_profiles))
-            
-            for i, profile in enumerate(chrome_profiles):
-                try:
-                    # Launch Chrome with the profile
-                    if platform.system() == "Windows":
-                        cmd = f'start "" "{self.chrome_path}" --new-window "{quality_url}" --profile-directory="{profile}" {" ".join(chrome_params)}'
-                        process = subprocess.Popen(cmd, shell=True)
-                    else:  # macOS or Linux
-                        cmd = [self.chrome_path, "--new-window", quality_url, f"--profile-directory={profile}"] + chrome_params
-                        process = subprocess.Popen(cmd)
-                        
-                    self.processes.append(process)
-                    time.sleep(1)  # Wait between launches to avoid overwhelming the system
+
+            with ThreadPoolExecutor(max_workers=min(8, max(1, len(chrome_profiles)))) as executor:
+                # Shared argv prefix comes from the cache; each worker only
+                # appends its own --profile-directory flag
+                base_args = self._chrome_argv_base() + [quality_url]
+                futures = [executor.submit(self._spawn_one, profile, base_args)
+                           for profile in chrome_profiles]
+                for future in as_completed(futures):
+                    try:
+                        process = future.result()
+                        self.processes.append(process)
+                        self._register_chrome_process(process)
+                    except Exception as e:
+                        self.console.print(f"[bold red]Error launching Chrome: {e}[/bold red]")
                     progress.update(task, advance=1)
-                except Exception as e:
-                    self.console.print(f"[bold red]Error launching Chrome: {e}[/bold red]")
-        
+
         # Wait for windows to load
         self.console.print("[bold yellow]Waiting for Chrome windows to load...[/bold yellow]")
-        time.sleep(5)
-        
+        self._wait_for_windows(len(chrome_profiles))
+
         # Start tracking watch time
         self.start_watch_time_tracking()
-        
+
         return True
 
+    def _wait_for_windows(self, expected, timeout=10):
+        """Poll until the expected number of Chrome windows exist or timeout passes
+
+        Replaces the old flat five-second sleep: fast machines move on as
+        soon as the windows are up, slow ones get up to the full timeout.
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                if len(self._find_chrome_windows()) >= expected:
+                    return
+            except Exception:
+                pass
+            time.sleep(0.5)
+
+    def _spawn_one(self, profile, base_args):
+        """Launch a single Chrome window for the given profile"""
+        cmd = base_args + [f"--profile-directory={profile}"]
+        # Chrome chatters on stdout/stderr; discard it so it cannot scribble
+        # over the rich-controlled terminal
+        if _IS_WINDOWS:
+            # Launch Chrome directly rather than through `start ""` with
+            # shell=True, which paid for a cmd.exe per window and left
+            # profile/streamer names exposed to shell quoting. DETACHED_PROCESS
+            # keeps Chrome off our console so it survives the launcher exiting.
+            return subprocess.Popen(
+                cmd,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                creationflags=subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.DETACHED_PROCESS
+            )
+        # start_new_session puts Chrome in its own process group, so a
+        # Ctrl+C meant for the launcher is not forwarded to every window.
+        # close_fds=False skips the fd-closing pass; PEP 446 already makes
+        # Python-created fds non-inheritable, and together with having no
+        # preexec_fn this keeps the spawn on CPython's vfork fast path
+        # (posix_spawn itself is off the table while we need setsid).
+        return subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            close_fds=False,
+            start_new_session=True
+        )
+
+    def _chrome_flags(self):
+        """Build the Chrome flag list shared by every launch path
+
+        GPU compositing stays on by default: forcing CPU compositing on
+        10+ simultaneous video tiles blows the CPU budget. The old
+        always-on disable flags are now opt-in via gpu_mode == "cpu".
+        """
+        params = ["--disable-plugins"]
+        if self.gpu_mode == "cpu":
+            params += ["--disable-software-rasterizer", "--disable-gpu-compositing"]
+        if self.memory_limit_per_process:
+            params.append(f"--js-flags=--max-old-space-size={self.memory_limit_per_process}")
+        return params
+
+    def _chrome_argv_base(self):
+        """Prebuilt [chrome, --new-window, *flags] argv prefix
+
+        Cached so launches and crash recovery skip re-deriving the flag
+        list; rebuilt automatically when the flag-affecting settings
+        change. Callers append the URL and --profile-directory.
+        """
+        flags = self._chrome_flags()
+        cached = self._argv_base_cache
+        if cached is None or cached[0] != flags:
+            cached = (flags, [self.chrome_path, "--new-window"] + flags)
+            self._argv_base_cache = cached
+        return cached[1]
+
     def arrange_windows(self):
         """Find and arrange Chrome windows in a grid"""
         try:
@@ -484,31 +958,28 @@ class TwitchLauncher:
                 return self.arrange_windows_with_layout(self.monitor_layouts[self.active_layout])
                 
             # Otherwise, use default arrangement
-            # Find Chrome windows
-            all_windows = gw.getWindowsWithTitle('')
-            self.windows = [w for w in all_windows if ('Twitch' in w.title or 'Chrome' in w.title)]
-            self.windows = self.windows[:self.num_windows]  # Limit to requested number
+            # Find Chrome windows, limited to the requested number
+            self.windows = self._find_chrome_windows()[:self.num_windows]
             
             if not self.windows:
                 self.console.print("[bold red]No Chrome windows found![/bold red]")
                 return False
                 
-            # Get monitor information
+            # Get (cached) placements and arrange windows
             monitors = self.get_screen_resolution()
-            cols, rows, win_width, win_height, offset_x, offset_y = self.calculate_grid(self.num_windows, monitors)
-            
-            # Arrange windows
-            x, y = offset_x, offset_y
-            for win in self.windows:
+            positions = self._grid_positions(self.num_windows, monitors)
+
+            # Each move/resize is a blocking window-manager round trip, so
+            # dispatch them concurrently rather than one window at a time
+            def place(args):
+                win, (x, y, win_width, win_height) = args
                 try:
-                    win.moveTo(x, y)
-                    win.resizeTo(win_width, win_height)
-                    x += win_width
-                    if x + win_width > offset_x + monitors[0]["width"]:
-                        x = offset_x
-                        y += win_height
+                    self._position_window(win, x, y, win_width, win_height)
                 except Exception as e:
                     self.console.print(f"[bold red]Error positioning window: {e}[/bold red]")
+
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(place, zip(self.windows, positions)))
                     
             self.console.print("[bold green]✅ Windows arranged successfully![/bold green]")
             return True
@@ -516,49 +987,122 @@ class TwitchLauncher:
             self.console.print(f"[bold red]Error arranging windows: {e}[/bold red]")
             return False
 
+    # SWP_NOZORDER | SWP_NOACTIVATE: keep stacking order and don't steal focus
+    _SWP_FLAGS = 0x0014
+
+    def _position_window(self, win, x, y, width, height):
+        """Move and resize a window in one window-manager call where possible"""
+        if _IS_WINDOWS:
+            # pygetwindow's moveTo + resizeTo issue two SetWindowPos round
+            # trips per window; one direct call does both and skips the
+            # focus-thrash of activating each window as it moves
+            ctypes.windll.user32.SetWindowPos(win._hWnd, 0, x, y, width, height, self._SWP_FLAGS)
+        else:
+            win.moveTo(x, y)
+            win.resizeTo(width, height)
+
+    def _position_windows(self, placements):
+        """Apply many (win, x, y, width, height) placements at once
+
+        On Windows the DeferWindowPos API batches every move/resize into a
+        single window-manager transaction: N+2 calls instead of 2N
+        SetWindowPos round trips, with no intermediate repaints. Elsewhere
+        (or if the batch fails) each window is placed in turn.
+        """
+        if _IS_WINDOWS and placements:
+            user32 = ctypes.windll.user32
+            hdwp = user32.BeginDeferWindowPos(len(placements))
+            for win, x, y, width, height in placements:
+                if not hdwp:
+                    break
+                hdwp = user32.DeferWindowPos(hdwp, win._hWnd, 0, x, y, width, height, self._SWP_FLAGS)
+            if hdwp and user32.EndDeferWindowPos(hdwp):
+                return
+
+        # Fast path first: one exception handler around the whole loop
+        # instead of setup/teardown per window. Placement is idempotent,
+        # so one bad window just reruns the loop in guarded form below.
+        try:
+            for win, x, y, width, height in placements:
+                self._position_window(win, x, y, width, height)
+            return
+        except Exception:
+            pass
+
+        for win, x, y, width, height in placements:
+            try:
+                self._position_window(win, x, y, width, height)
+            except Exception as e:
+                self.console.print(f"[bold red]Error positioning window: {e}[/bold red]")
+
+    def _terminate_procs(self, processes):
+        """Terminate the given Popen handles together and reap them in one wait"""
+        procs = []
+        for process in processes:
+            try:
+                if process.poll() is None:
+                    procs.append(psutil.Process(process.pid))
+            except psutil.NoSuchProcess:
+                pass
+            self._drop_chrome_process(process.pid)
+
+        for proc in procs:
+            try:
+                proc.terminate()
+            except psutil.NoSuchProcess:
+                pass
+
+        # Reap everything at once instead of blocking per process
+        gone, alive = psutil.wait_procs(procs, timeout=3)
+        for proc in alive:
+            try:
+                proc.kill()
+            except psutil.NoSuchProcess:
+                pass
+
+    def _close_window_handles(self, windows):
+        """Close window handles concurrently; each close blocks on the window manager"""
+        def close_one(win):
+            try:
+                win.close()
+            except Exception:
+                pass
+
+        if windows:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(close_one, windows))
+
     def close_windows(self, count=None):
         """Close a specific number of windows or all windows"""
         if count is None:
             # Close all windows
-            for process in self.processes:
-                try:
-                    process.terminate()
-                except:
-                    pass
-            self.processes = []
-            
+            self._terminate_procs(self.processes)
+            self.processes.clear()
+
             # Try to close by window handle as well
-            for win in self.windows:
-                try:
-                    win.close()
-                except:
-                    pass
-            self.windows = []
-            
+            self._close_window_handles(self.windows)
+            self.windows.clear()
+
             self.console.print("[bold green]✅ All windows closed![/bold green]")
         else:
-            # Close specific number of windows
+            # Close specific number of windows; one slice + one del keeps
+            # it a single list resize instead of a resize per pop
             count = min(count, len(self.processes))
-            for _ in range(count):
-                try:
-                    process = self.processes.pop()
-                    process.terminate()
-                except:
-                    pass
-                    
+            victims = self.processes[-count:] if count else []
+            del self.processes[len(self.processes) - count:]
+            self._terminate_procs(victims)
+
             # Try to close by window handle as well
-            for _ in range(min(count, len(self.windows))):
-                try:
-                    win = self.windows.pop()
-                    win.close()
-                except:
-                    pass
-                    
+            window_count = min(count, len(self.windows))
+            window_victims = self.windows[-window_count:] if window_count else []
+            del self.windows[len(self.windows) - window_count:]
+            self._close_window_handles(window_victims)
+
             self.console.print(f"[bold green]✅ Closed {count} windows![/bold green]")
 
     def change_quality(self):
         """Change the quality of all streams"""
-        quality_options = ["auto", "source", "720p", "480p", "360p", "160p"]
+        quality_options = self._QUALITY_OPTIONS
         
         self.console.print("[bold yellow]Available quality options:[/bold yellow]")
         for i, quality in enumerate(quality_options, 1):
@@ -571,7 +1115,7 @@ class TwitchLauncher:
         
         # Handle both number input and direct quality name
         new_quality = None
-        if quality_choice.isdigit() and 1 <= int(quality_choice) <= len(quality_options):
+        if quality_choice.isdecimal() and 1 <= int(quality_choice) <= len(quality_options):
             new_quality = quality_options[int(quality_choice) - 1]
         elif quality_choice in quality_options:
             new_quality = quality_choice
@@ -594,32 +1138,36 @@ class TwitchLauncher:
         """Start tracking watch time for all windows"""
         self.session_start_time = time.time()
         
-        # Initialize watch start times for each window
-        for i in range(self.num_windows):
-            self.watch_start_times[i] = time.time()
-            
-        # Start watch time tracking thread
-        self.watch_time_thread = threading.Thread(target=self.update_watch_time, daemon=True)
-        self.watch_time_thread.start()
-        
-    def update_watch_time(self):
+        # Initialize watch start times for each window; a packed double
+        # array instead of an int-keyed dict, indexed straight by window
+        self.watch_start_times = array.array('d', [self.session_start_time] * self.num_windows)
+
+
+        # Track watch time on the shared background loop instead of a
+        # dedicated thread
+        if self.watch_time_task is None or self.watch_time_task.done():
+            self.watch_time_task = self._submit_background(self.update_watch_time())
+
+    async def update_watch_time(self):
         """Update and display watch time periodically"""
         update_interval = 60  # Update every minute
-        
+
         while self.running:
-            time.sleep(update_interval)
-            
+            await asyncio.sleep(update_interval)
             current_time = time.time()
             self.total_session_time = current_time - self.session_start_time
             
             # Log watch time to console occasionally
-            hours = int(self.total_session_time // 3600)
-            minutes = int((self.total_session_time % 3600) // 60)
-            
+            hours, rem = divmod(int(self.total_session_time), 3600)
+            minutes = rem // 60
+
+
+            # Publish through the shared Live status line; a raw end="\r"
+            # print here would fight the monitor output for the same row
             if hours > 0:
-                self.console.print(f"[green]Session watch time: {hours}h {minutes}m[/green]", end="\r")
+                self._update_status("watch_time", f"[green]Session watch time: {hours}h {minutes}m[/green]")
             else:
-                self.console.print(f"[green]Session watch time: {minutes}m[/green]", end="\r")
+                self._update_status("watch_time", f"[green]Session watch time: {minutes}m[/green]")
 
     def show_watch_time_stats(self):
         """Display detailed watch time statistics"""
@@ -630,10 +1178,10 @@ class TwitchLauncher:
         current_time = time.time()
         self.total_session_time = current_time - self.session_start_time
         
-        # Calculate session time
-        hours = int(self.total_session_time // 3600)
-        minutes = int((self.total_session_time % 3600) // 60)
-        seconds = int(self.total_session_time % 60)
+        # Calculate session time; divmod yields all three fields in two
+        # divisions instead of three division/modulo pairs
+        hours, rem = divmod(int(self.total_session_time), 3600)
+        minutes, seconds = divmod(rem, 60)
         
         # Create a table to display the statistics
         table = Table(title="Twitch Watch Time Statistics")
@@ -647,16 +1195,12 @@ class TwitchLauncher:
         start_datetime = datetime.datetime.fromtimestamp(self.session_start_time).strftime("%Y-%m-%d %H:%M:%S")
         
         # Add rows for each window
-        for i in range(self.num_windows):
-            if i in self.watch_start_times:
-                window_watch_time = current_time - self.watch_start_times[i]
-                w_hours = int(window_watch_time // 3600)
-                w_minutes = int((window_watch_time % 3600) // 60)
-                w_seconds = int(window_watch_time % 60)
-                
-                window_time = f"{w_hours:02d}:{w_minutes:02d}:{w_seconds:02d}"
-                
-                table.add_row(f"Window {i+1}", window_time)
+        watch_start_times = self.watch_start_times
+        for i in range(min(self.num_windows, len(watch_start_times))):
+            w_hours, rem = divmod(int(current_time - watch_start_times[i]), 3600)
+            w_minutes, w_seconds = divmod(rem, 60)
+
+            table.add_row(f"Window {i+1}", f"{w_hours:02d}:{w_minutes:02d}:{w_seconds:02d}")
         
         # Add the session total as the last row
         table.add_row("Total Session", formatted_time, style="bold")
@@ -666,10 +1210,14 @@ class TwitchLauncher:
 
     def show_profiles(self):
         """Display available profiles"""
+        # Stash the display order so selection prompts can map a number to
+        # a profile id without rebuilding the key list per menu click
+        self._profile_order = list(self.profiles.keys())
+
         if not self.profiles:
             self.console.print("[bold yellow]No profiles found. Create one using option 'Create new profile'.[/bold yellow]")
             return
-            
+
         self.console.print("\n[bold blue]Available Profiles[/bold blue]")
         
         table = Table(show_header=True, header_style="bold magenta")
@@ -706,18 +1254,18 @@ class TwitchLauncher:
         if choice.lower() == 'q':
             return False
             
-        try:
-            index = int(choice) - 1
-            if index < 0 or index >= len(self.profiles):
-                self.console.print("[bold red]Invalid profile number.[/bold red]")
-                return False
-                
-            profile_id = list(self.profiles.keys())[index]
-            return self.activate_profile(profile_id)
-        except ValueError:
+        number = _parse_int(choice)
+        if number is None:
             self.console.print("[bold red]Please enter a valid number.[/bold red]")
             return False
 
+        index = number - 1
+        if index < 0 or index >= len(self._profile_order):
+            self.console.print("[bold red]Invalid profile number.[/bold red]")
+            return False
+
+        return self.activate_profile(self._profile_order[index])
+
     def activate_profile(self, profile_id):
         """Activate a profile and launch windows according to its settings"""
         if profile_id not in self.profiles:
@@ -734,10 +1282,15 @@ class TwitchLauncher:
         self.quality = profile.get("quality", "auto")
         self.url = f"https://www.twitch.tv/{self.streamer}" if self.streamer else "https://www.twitch.tv"
         
-        # Set current profile
+        # Set current profile; skip the settings write when re-activating
+        # with identical values (recovery flows can re-trigger this). The
+        # snapshot is maintained by save_settings itself, so any save in
+        # between (quality change, user input) invalidates the skip.
         self.current_profile = profile_id
-        self.save_settings()
-        
+        new_state = (self.num_windows, self.streamer, self.quality, self.current_profile or None)
+        if new_state != self._last_saved_state:
+            self.save_settings()
+
         # Close any existing windows
         self.close_windows()
         
@@ -773,49 +1326,51 @@ class TwitchLauncher:
         # Validate profiles exist
         valid_profiles = self.validate_chrome_profiles(chrome_profiles)
         
-        # Chrome parameters
-        chrome_params = [
-            "--disable-plugins",
-            "--disable-software-rasterizer",
-            "--disable-gpu-compositing"
-        ]
-        
-        # Add memory limit if specified
-        if self.memory_limit_per_process:
-            chrome_params.append(f"--js-flags=--max-old-space-size={self.memory_limit_per_process}")
-        
-        # Launch Chrome with different profiles
+        # Launch Chrome with different profiles concurrently, same as the
+        # main launcher; the per-spawn one-second pause only added latency.
+        # Per-profile outcomes go to the file log; the console gets one
+        # summary line after the batch.
+        launch_start = time.monotonic()
+        launched = 0
         with Progress() as progress:
             task = progress.add_task("[cyan]Launching Chrome windows...", total=len(valid_profiles))
-            
-            for i, profile in enumerate(valid_profiles):
-                try:
-                    # Launch Chrome with the profile
-                    if platform.system() == "Windows":
-                        cmd = f'start "" "{self.chrome_path}" --new-window "{quality_url}" --profile-directory="{profile}" {" ".join(chrome_params)}'
-                        process = subprocess.Popen(cmd, shell=True)
-                    else:  # macOS or Linux
-                        cmd = [self.chrome_path, "--new-window", quality_url, f"--profile-directory={profile}"] + chrome_params
-                        process = subprocess.Popen(cmd)
-                        
+
+            with ThreadPoolExecutor(max_workers=min(8, max(1, len(valid_profiles)))) as executor:
+                base_args = self._chrome_argv_base() + [quality_url]
+                futures = {executor.submit(self._spawn_one, profile, base_args): profile
+                           for profile in valid_profiles}
+                for future in as_completed(futures):
+                    profile = futures[future]
+                    try:
+                        process = future.result()
+                    except Exception as e:
+                        _log.error("Failed to launch Chrome for %s: %s", profile, e)
+                        continue
+
+                    _log.info("Launched Chrome for %s (pid %d)", profile, process.pid)
+                    launched += 1
+                    index = len(self.processes)
                     self.processes.append(process)
-                    
+                    self._register_chrome_process(process)
+
                     # Initialize window state for crash recovery
-                    self.window_states[i] = {
+                    self.window_states[index] = {
                         "profile": profile,
                         "url": quality_url,
                         "active": True,
                         "last_check": time.time()
                     }
-                    
-                    time.sleep(1)  # Wait between launches to avoid overwhelming the system
                     progress.update(task, advance=1)
-                except Exception as e:
-                    self.console.print(f"[bold red]Error launching Chrome: {e}[/bold red]")
-        
-        # Wait for windows to load
+
+        elapsed = time.monotonic() - launch_start
+        style = "bold green" if launched == len(valid_profiles) else "bold yellow"
+        self.console.print(f"[{style}]Launched {launched}/{len(valid_profiles)} Chrome windows in {elapsed:.1f}s[/{style}]")
+
+        # Wait for windows to load, then index them by profile for the
+        # crash monitor
         self.console.print("[bold yellow]Waiting for Chrome windows to load...[/bold yellow]")
-        time.sleep(5)
+        self._wait_for_windows(len(valid_profiles))
+        self._refresh_window_index()
         
         # Start tracking watch time
         self.start_watch_time_tracking()
@@ -826,28 +1381,49 @@ class TwitchLauncher:
         return True
 
     def load_all_profiles(self):
-        """Load all saved profiles from the profiles directory"""
+        """Load all saved profiles from the profiles directory
+
+        Parsed files are cached keyed on mtime, so repeated menu visits
+        only re-read profiles that actually changed on disk.
+        """
         self.profiles = {}
-        
+        seen_files = set()
+
         try:
             if not self.profiles_dir.exists():
                 return
-                
+
             for profile_file in self.profiles_dir.glob("*.json"):
+                # layouts.json holds monitor layouts, not a profile, and
+                # layout_*.json files are pre-consolidation layouts that
+                # migration couldn't remove (e.g. unreadable or read-only)
+                if profile_file.name == "layouts.json" or profile_file.name.startswith("layout_"):
+                    continue
+                seen_files.add(profile_file)
                 try:
-                    with open(profile_file, "r") as f:
-                        profile_data = json.load(f)
-                        
-                        # Validate required fields
-                        if "id" in profile_data and "name" in profile_data:
-                            self.profiles[profile_data["id"]] = profile_data
-                except json.JSONDecodeError:
+                    mtime = profile_file.stat().st_mtime
+                    cached = self._profile_cache.get(profile_file)
+                    if cached is not None and cached[0] == mtime:
+                        profile_data = cached[1]
+                    else:
+                        with open(profile_file, "rb") as f:
+                            profile_data = _json_loads(f.read())
+                        self._profile_cache[profile_file] = (mtime, profile_data)
+
+                    # Validate required fields
+                    if "id" in profile_data and "name" in profile_data:
+                        self.profiles[profile_data["id"]] = profile_data
+                except ValueError:
                     self.console.print(f"[bold red]Error reading profile file {profile_file}. Skipping.[/bold red]")
                 except Exception as e:
                     self.console.print(f"[bold red]Error loading profile {profile_file}: {e}[/bold red]")
         except Exception as e:
             self.console.print(f"[bold red]Error loading profiles: {e}[/bold red]")
-            
+
+        # Drop cache entries for files deleted since the last scan
+        for stale in [path for path in self._profile_cache if path not in seen_files]:
+            del self._profile_cache[stale]
+
         self.console.print(f"[green]Loaded {len(self.profiles)} profiles.[/green]")
 
     def create_new_profile(self):
@@ -863,8 +1439,12 @@ class TwitchLauncher:
         
         # Get chrome profiles
         chrome_profiles = []
-        num_windows = int(Prompt.ask("[bold yellow]How many windows for this profile?[/bold yellow]", default="4"))
-        
+        num_windows = _parse_int(Prompt.ask("[bold yellow]How many windows for this profile?[/bold yellow]", default="4"))
+
+        if num_windows is None:
+            self.console.print("[bold red]Please enter a valid number.[/bold red]")
+            return False
+
         if num_windows <= 0:
             self.console.print("[bold red]Number of windows must be positive.[/bold red]")
             return False
@@ -884,7 +1464,7 @@ class TwitchLauncher:
         streamer = Prompt.ask("[bold yellow]Enter a streamer name or leave blank for the Twitch homepage[/bold yellow]", default="").strip()
         
         # Get stream quality
-        quality_options = ["auto", "source", "720p", "480p", "360p", "160p"]
+        quality_options = self._QUALITY_OPTIONS
         self.console.print("[bold yellow]Available quality options:[/bold yellow]")
         for i, quality in enumerate(quality_options, 1):
             self.console.print(f"  {i}. {quality}")
@@ -892,7 +1472,7 @@ class TwitchLauncher:
         quality_choice = Prompt.ask("[bold yellow]Select stream quality[/bold yellow]", default="auto")
         
         # Handle both number input and direct quality name
-        if quality_choice.isdigit() and 1 <= int(quality_choice) <= len(quality_options):
+        if quality_choice.isdecimal() and 1 <= int(quality_choice) <= len(quality_options):
             quality = quality_options[int(quality_choice) - 1]
         elif quality_choice in quality_options:
             quality = quality_choice
@@ -917,9 +1497,8 @@ class TwitchLauncher:
         # Save profile
         try:
             profile_file = self.profiles_dir / f"{profile_id}.json"
-            with open(profile_file, "w") as f:
-                json.dump(new_profile, f, indent=2)
-                
+            _write_json_atomic(profile_file, new_profile)
+
             self.profiles[profile_id] = new_profile
             self.console.print(f"[bold green]✅ Profile '{profile_name}' created successfully![/bold green]")
             
@@ -950,8 +1529,12 @@ class TwitchLauncher:
         profile_description = Prompt.ask("[bold yellow]Enter profile description[/bold yellow]", default=profile.get("description", ""))
         
         # Edit number of windows
-        num_windows = int(Prompt.ask("[bold yellow]How many windows for this profile?[/bold yellow]", default=str(profile["num_windows"])))
-        
+        num_windows = _parse_int(Prompt.ask("[bold yellow]How many windows for this profile?[/bold yellow]", default=str(profile["num_windows"])))
+
+        if num_windows is None:
+            self.console.print("[bold red]Please enter a valid number.[/bold red]")
+            return False
+
         if num_windows <= 0:
             self.console.print("[bold red]Number of windows must be positive.[/bold red]")
             return False
@@ -984,7 +1567,7 @@ class TwitchLauncher:
         streamer = Prompt.ask("[bold yellow]Enter a streamer name or leave blank for the Twitch homepage[/bold yellow]", default=profile.get("streamer", "")).strip()
         
         # Edit quality
-        quality_options = ["auto", "source", "720p", "480p", "360p", "160p"]
+        quality_options = self._QUALITY_OPTIONS
         self.console.print("[bold yellow]Available quality options:[/bold yellow]")
         for i, quality in enumerate(quality_options, 1):
             self.console.print(f"  {i}. {quality}")
@@ -992,7 +1575,7 @@ class TwitchLauncher:
         quality_choice = Prompt.ask("[bold yellow]Select stream quality[/bold yellow]", default=profile.get("quality", "auto"))
         
         # Handle both number input and direct quality name
-        if quality_choice.isdigit() and 1 <= int(quality_choice) <= len(quality_options):
+        if quality_choice.isdecimal() and 1 <= int(quality_choice) <= len(quality_options):
             quality = quality_options[int(quality_choice) - 1]
         elif quality_choice in quality_options:
             quality = quality_choice
@@ -1011,9 +1594,8 @@ class TwitchLauncher:
         # Save profile
         try:
             profile_file = self.profiles_dir / f"{profile_id}.json"
-            with open(profile_file, "w") as f:
-                json.dump(profile, f, indent=2)
-                
+            _write_json_atomic(profile_file, profile)
+
             self.profiles[profile_id] = profile
             self.console.print(f"[bold green]✅ Profile '{profile_name}' updated successfully![/bold green]")
             
@@ -1039,11 +1621,12 @@ class TwitchLauncher:
             return False
             
         try:
-            # Delete profile file
+            # Delete profile file; missing_ok folds the exists() check and
+            # the unlink into one syscall with no race between them
             profile_file = self.profiles_dir / f"{profile_id}.json"
-            if profile_file.exists():
-                profile_file.unlink()
-                
+            profile_file.unlink(missing_ok=True)
+
+
             # Remove from profiles dictionary
             del self.profiles[profile_id]
             
@@ -1086,30 +1669,26 @@ class TwitchLauncher:
                 if self.profiles:
                     profile_num = Prompt.ask("[bold yellow]Enter profile number to edit or 'q' to cancel[/bold yellow]")
                     if profile_num.lower() != 'q':
-                        try:
-                            index = int(profile_num) - 1
-                            if 0 <= index < len(self.profiles):
-                                profile_id = list(self.profiles.keys())[index]
-                                self.edit_profile(profile_id)
-                            else:
-                                self.console.print("[bold red]Invalid profile number.[/bold red]")
-                        except ValueError:
+                        number = _parse_int(profile_num)
+                        if number is None:
                             self.console.print("[bold red]Please enter a valid number.[/bold red]")
+                        elif 0 <= number - 1 < len(self._profile_order):
+                            self.edit_profile(self._profile_order[number - 1])
+                        else:
+                            self.console.print("[bold red]Invalid profile number.[/bold red]")
             
             elif choice == "4":
                 self.show_profiles()
                 if self.profiles:
                     profile_num = Prompt.ask("[bold yellow]Enter profile number to delete or 'q' to cancel[/bold yellow]")
                     if profile_num.lower() != 'q':
-                        try:
-                            index = int(profile_num) - 1
-                            if 0 <= index < len(self.profiles):
-                                profile_id = list(self.profiles.keys())[index]
-                                self.delete_profile(profile_id)
-                            else:
-                                self.console.print("[bold red]Invalid profile number.[/bold red]")
-                        except ValueError:
+                        number = _parse_int(profile_num)
+                        if number is None:
                             self.console.print("[bold red]Please enter a valid number.[/bold red]")
+                        elif 0 <= number - 1 < len(self._profile_order):
+                            self.delete_profile(self._profile_order[number - 1])
+                        else:
+                            self.console.print("[bold red]Invalid profile number.[/bold red]")
             
             elif choice == "5":
                 self.select_profile()
@@ -1139,7 +1718,9 @@ class TwitchLauncher:
             table.add_row("10", "Import settings")
             table.add_row("11", "Profile management")
             table.add_row("12", "Multiple monitor layout settings")
-            table.add_row("13", "Exit script")
+            table.add_row("13", "Optimize Chrome process priorities")
+            table.add_row("14", "Refresh monitor detection")
+            table.add_row("15", "Exit script")
             self.console.print(table)
 
             choice = Prompt.ask("[bold yellow]Select an option[/bold yellow]")
@@ -1149,14 +1730,13 @@ class TwitchLauncher:
                 self.close_windows()
             
             elif choice == "2":
-                try:
-                    close_count = int(Prompt.ask("[bold yellow]How many windows do you want to close?[/bold yellow]"))
-                    if close_count <= 0:
-                        self.console.print("[bold red]Number must be positive.[/bold red]")
-                    else:
-                        self.close_windows(close_count)
-                except ValueError:
+                close_count = _parse_int(Prompt.ask("[bold yellow]How many windows do you want to close?[/bold yellow]"))
+                if close_count is None:
                     self.console.print("[bold red]Please enter a valid number.[/bold red]")
+                elif close_count <= 0:
+                    self.console.print("[bold red]Number must be positive.[/bold red]")
+                else:
+                    self.close_windows(close_count)
 
             elif choice == "3":
                 self.console.print("[bold green]📡 Network usage is displayed live in the terminal.[/bold green]")
@@ -1205,6 +1785,12 @@ class TwitchLauncher:
                 self.manage_monitor_layouts()
             
             elif choice == "13":
+                self.optimize_processes()
+
+            elif choice == "14":
+                self.refresh_monitors()
+
+            elif choice == "15":
                 self.console.print("[bold red]🔴 Exiting script...[/bold red]")
                 self.running = False
             
@@ -1213,80 +1799,125 @@ class TwitchLauncher:
 
     def start_crash_recovery(self):
         """Start monitoring for crashed windows and recover them"""
-        if self.crash_recovery_thread and self.crash_recovery_thread.is_alive():
+        if self.crash_recovery_task and not self.crash_recovery_task.done():
             return
-            
-        self.crash_recovery_thread = threading.Thread(target=self._monitor_crashes, daemon=True)
-        self.crash_recovery_thread.start()
-        
-    def _monitor_crashes(self):
+
+        self.crash_recovery_task = self._submit_background(self._monitor_crashes())
+
+    async def _monitor_crashes(self):
         """Monitor for crashed windows and recover them"""
         check_interval = 5  # Check every 5 seconds
         
         while self.running:
             try:
                 current_time = time.time()
-                
+
+                # The profile -> window index answers existence checks
+                # without enumerating OS windows; refresh it at most once
+                # per tick, and only when a lookup actually misses
+                index_refreshed = False
+                recovered = []
+                failed = []
+
                 # Check each window's state
                 for window_index, state in list(self.window_states.items()):
                     if not state["active"]:
                         continue
-                        
-                    # Check if window exists
-                    window_exists = False
-                    for win in self.windows:
-                        if win.title and state["profile"] in win.title:
-                            window_exists = True
-                            break
-                            
+
+                    # Fast liveness pre-check on the held Popen handle:
+                    # poll() is one waitpid(WNOHANG) and reaps the child
+                    # if it already exited. A live launch process means
+                    # the window is fine; a dead one still falls through
+                    # to the window check, since Chrome can hand the
+                    # window off to an existing browser process.
+                    if window_index < len(self.processes):
+                        process = self.processes[window_index]
+                        if process.poll() is None:
+                            state["last_check"] = current_time
+                            continue
+                        self._drop_chrome_process(process.pid)
+
+                    # Check the window index; a miss may just mean the
+                    # index is stale, so refill it once before believing it
+                    window_exists = state["profile"] in self._window_index
+                    if not window_exists and not index_refreshed:
+                        self._refresh_window_index()
+                        index_refreshed = True
+                        window_exists = state["profile"] in self._window_index
+
                     # If window doesn't exist and hasn't been checked recently
                     if not window_exists and (current_time - state["last_check"]) > check_interval:
-                        self.console.print(f"[bold yellow]Window {window_index + 1} (Profile: {state['profile']}) appears to have crashed. Attempting recovery...[/bold yellow]")
-                        
+                        _log.warning("Window %d (profile %s) appears to have crashed; attempting recovery",
+                                     window_index + 1, state["profile"])
+
                         try:
-                            # Launch new Chrome window with the same profile
-                            if platform.system() == "Windows":
-                                cmd = f'start "" "{self.chrome_path}" --new-window "{state["url"]}" --profile-directory="{state["profile"]}" --disable-plugins --disable-software-rasterizer --disable-gpu-compositing'
-                                process = subprocess.Popen(cmd, shell=True)
-                            else:  # macOS or Linux
-                                cmd = [self.chrome_path, "--new-window", state["url"], f"--profile-directory={state['profile']}", "--disable-plugins", "--disable-software-rasterizer", "--disable-gpu-compositing"]
-                                process = subprocess.Popen(cmd)
-                                
+                            # Relaunch through the shared spawn helper: no
+                            # intermediate cmd.exe, same detach flags and
+                            # cached argv prefix as the initial launch
+                            process = self._spawn_one(state["profile"],
+                                                      self._chrome_argv_base() + [state["url"]])
+
+
                             # Update process list
                             if window_index < len(self.processes):
                                 self.processes[window_index] = process
                             else:
                                 self.processes.append(process)
+                            self._register_chrome_process(process)
                                 
                             # Update window state
                             state["last_check"] = current_time
-                            self.console.print(f"[bold green]✅ Window {window_index + 1} recovered successfully![/bold green]")
-                            
-                            # Wait for window to load
-                            time.sleep(5)
-                            
-                            # Rearrange windows to maintain layout
-                            self.arrange_windows()
-                            
+                            recovered.append(state["profile"])
+                            _log.info("Window %d (profile %s) recovered, pid %d",
+                                      window_index + 1, state["profile"], process.pid)
+
                         except Exception as e:
-                            self.console.print(f"[bold red]Error recovering window {window_index + 1}: {e}[/bold red]")
+                            failed.append(state["profile"])
+                            _log.error("Error recovering window %d (profile %s): %s",
+                                       window_index + 1, state["profile"], e)
                             state["active"] = False  # Mark as inactive if recovery failed
-                            
-                time.sleep(check_interval)
-                
+
+                # One console line per tick instead of a print per window
+                if recovered:
+                    self.console.print(f"[bold green]✅ Recovered {len(recovered)} window(s): {', '.join(recovered)}[/bold green]")
+                if failed:
+                    self.console.print(f"[bold red]Failed to recover {len(failed)} window(s): {', '.join(failed)} (see twitch_launcher.log)[/bold red]")
+
+                # Arrange once per tick no matter how many windows came
+                # back, instead of a full load-wait + rearrange apiece
+                if recovered:
+                    await asyncio.sleep(5)
+                    self._refresh_window_index()
+                    self.arrange_windows()
+
+                await asyncio.sleep(check_interval)
+
             except Exception as e:
                 self.console.print(f"[bold red]Error in crash recovery monitoring: {e}[/bold red]")
-                time.sleep(check_interval)
+                await asyncio.sleep(check_interval)
                 
     def cleanup(self):
         """Clean up resources on exit"""
         self.running = False
-        if self.network_thread and self.network_thread.is_alive():
-            self.network_thread.join(timeout=1)
-        if self.watch_time_thread and self.watch_time_thread.is_alive():
-            self.watch_time_thread.join(timeout=1)
-        if self.crash_recovery_thread and self.crash_recovery_thread.is_alive():
-            self.crash_recovery_thread.join(timeout=1)
+        if self._layouts_dirty:
+            self.save_layouts()
+        if self._settings_dirty:
+            self.save_settings()
+            self._settings_dirty = False
+        for task in (self.watch_time_task, self.crash_recovery_task):
+            if task and not task.done():
+                task.cancel()
+        if self._background_thread and self._background_thread.is_alive():
+            # Wake the loop rather than letting join eat its whole timeout:
+            # cancelling the gather ends gather_monitors, and asyncio.run
+            # then cancels any leftover tasks and closes the loop
+            if self._background_loop is not None and self._monitor_gather is not None:
+                self._background_loop.call_soon_threadsafe(self._monitor_gather.cancel)
+            self._background_thread.join(timeout=1)
+        with self._status_lock:
+            if self._status_live is not None:
+                self._status_live.stop()
+                self._status_live = None
         self.close_windows()
 
     def run(self):
@@ -1305,9 +1936,8 @@ class TwitchLauncher:
             # Arrange windows
             self.arrange_windows()
             
-            # Start network monitoring in a separate thread
-            self.network_thread = threading.Thread(target=self.monitor_network, daemon=True)
-            self.network_thread.start()
+            # Start the network/resource monitors on the background loop
+            self._start_background_monitors()
             
             # Show menu
             self.show_menu()
@@ -1317,6 +1947,103 @@ class TwitchLauncher:
         finally:
             self.cleanup()
 
+    def load_monitor_layouts(self):
+        """Load all saved monitor layouts from the single layouts file
+
+        Layouts used to live in one layout_<id>.json file each; any legacy
+        files found are folded into layouts.json and removed so the whole
+        set is read and written in one I/O operation from then on.
+        """
+        try:
+            if self.layouts_file.exists():
+                with open(self.layouts_file, "rb") as f:
+                    data = _json_loads(f.read())
+                # Valid JSON isn't necessarily the right shape; a hand-
+                # edited file must degrade to the error message, not an
+                # AttributeError that keeps the app from starting
+                if not isinstance(data, dict):
+                    raise ValueError("layouts file is not a JSON object")
+                if "layouts" in data:
+                    layouts = data["layouts"]
+                    if not isinstance(layouts, dict):
+                        raise ValueError("'layouts' is not a JSON object")
+                    monitors = data.get("monitors")
+                    self.monitors_index = monitors if isinstance(monitors, list) else []
+                    self.monitor_layouts = layouts
+                else:
+                    # Flat {id: layout} file from before monitor interning
+                    self.monitor_layouts = data
+        except ValueError:
+            self.console.print(f"[bold red]Error reading layouts file {self.layouts_file}. Skipping.[/bold red]")
+        except Exception as e:
+            self.console.print(f"[bold red]Error loading layouts: {e}[/bold red]")
+
+        # Migrate legacy per-layout files into the consolidated file
+        migrated = False
+        for layout_file in self.profiles_dir.glob("layout_*.json"):
+            try:
+                with open(layout_file, "rb") as f:
+                    layout = _json_loads(f.read())
+                if isinstance(layout, dict) and "id" in layout:
+                    self.monitor_layouts.setdefault(layout["id"], layout)
+                layout_file.unlink()
+                migrated = True
+            except (ValueError, OSError):
+                self.console.print(f"[bold red]Error migrating layout file {layout_file}. Skipping.[/bold red]")
+
+        # Rebuild the intern lookup from the shared table, then fold any
+        # inline monitor dicts (legacy layouts) into it
+        self._monitor_keys = {
+            (m["width"], m["height"], m["x"], m["y"]): i
+            for i, m in enumerate(self.monitors_index)}
+        for layout in self.monitor_layouts.values():
+            if isinstance(layout, dict) and "monitor_idx" not in layout and "monitor" in layout:
+                layout["monitor_idx"] = self._intern_monitor(layout.pop("monitor"))
+                migrated = True
+
+        self._layout_order = list(self.monitor_layouts.keys())
+        if migrated:
+            self.save_layouts()
+
+    def _intern_monitor(self, monitor):
+        """Return the index of this monitor in the shared table, adding it once
+
+        Every layout on the same monitor references one table entry, so
+        the monitor geometry is serialized and parsed once per file, not
+        once per layout.
+        """
+        key = (monitor["width"], monitor["height"], monitor["x"], monitor["y"])
+        idx = self._monitor_keys.get(key)
+        if idx is None:
+            idx = len(self.monitors_index)
+            self.monitors_index.append(dict(monitor))
+            self._monitor_keys[key] = idx
+        return idx
+
+    def _layout_monitor(self, layout):
+        """Dereference a layout's monitor from the shared table"""
+        idx = layout.get("monitor_idx")
+        if idx is not None and 0 <= idx < len(self.monitors_index):
+            return self.monitors_index[idx]
+        # Legacy inline dict, or a table index that didn't survive a
+        # hand-edited file; fall back rather than crash the arrangement
+        return layout.get("monitor", {"width": 1920, "height": 1080, "x": 0, "y": 0})
+
+    def save_layouts(self):
+        """Write the monitor table and every layout to the layouts file"""
+        try:
+            # Atomic write-then-rename: a crash mid-write leaves the old
+            # file intact rather than a truncated one
+            _write_json_atomic(self.layouts_file, {
+                "monitors": self.monitors_index,
+                "layouts": self.monitor_layouts,
+            })
+            self._layouts_dirty = False
+            return True
+        except Exception as e:
+            self.console.print(f"[bold red]Error saving layouts: {e}[/bold red]")
+            return False
+
     def manage_monitor_layouts(self):
         """Show multiple monitor layout management menu"""
         while True:
@@ -1341,44 +2068,51 @@ class TwitchLauncher:
                 self.create_new_layout()
             
             elif choice == "3":
-                self.show_layouts()
-                if self.monitor_layouts:
-                    layout_num = Prompt.ask("[bold yellow]Enter layout number to edit or 'q' to cancel[/bold yellow]")
-                    if layout_num.lower() != 'q':
-                        try:
-                            index = int(layout_num) - 1
-                            if 0 <= index < len(self.monitor_layouts):
-                                layout_id = list(self.monitor_layouts.keys())[index]
-                                self.edit_layout(layout_id)
-                            else:
-                                self.console.print("[bold red]Invalid layout number.[/bold red]")
-                        except ValueError:
-                            self.console.print("[bold red]Please enter a valid number.[/bold red]")
-            
+                self._pick_layout_and("edit", self.edit_layout)
+
             elif choice == "4":
-                self.show_layouts()
-                if self.monitor_layouts:
-                    layout_num = Prompt.ask("[bold yellow]Enter layout number to delete or 'q' to cancel[/bold yellow]")
-                    if layout_num.lower() != 'q':
-                        try:
-                            index = int(layout_num) - 1
-                            if 0 <= index < len(self.monitor_layouts):
-                                layout_id = list(self.monitor_layouts.keys())[index]
-                                self.delete_layout(layout_id)
-                            else:
-                                self.console.print("[bold red]Invalid layout number.[/bold red]")
-                        except ValueError:
-                            self.console.print("[bold red]Please enter a valid number.[/bold red]")
-            
+                self._pick_layout_and("delete", self.delete_layout)
+
             elif choice == "5":
                 self.select_layout()
-            
+
             elif choice == "6":
+                # Coalesced flush: one write covers every edit this visit
+                if self._layouts_dirty:
+                    self.save_layouts()
+                if self._settings_dirty:
+                    self.save_settings()
+                    self._settings_dirty = False
                 return
-            
+
             else:
                 self.console.print("[bold red]❌ Invalid choice! Please select a valid option.[/bold red]")
                 
+    def _pick_layout_and(self, verb, fn):
+        """Show layouts, prompt for a number, and hand the chosen id to fn
+
+        One shared prompt/parse/bounds-check path for the edit and delete
+        menu branches, which used to duplicate it verbatim.
+        """
+        self.show_layouts()
+        if not self.monitor_layouts:
+            return
+
+        layout_num = Prompt.ask(f"[bold yellow]Enter layout number to {verb} or 'q' to cancel[/bold yellow]")
+        if layout_num.lower() == 'q':
+            return
+
+        number = _parse_int(layout_num)
+        if number is None:
+            self.console.print("[bold red]Please enter a valid number.[/bold red]")
+            return
+
+        index = number - 1
+        if 0 <= index < len(self._layout_order):
+            fn(self._layout_order[index])
+        else:
+            self.console.print("[bold red]Invalid layout number.[/bold red]")
+
     def show_monitors(self):
         """Display information about available monitors"""
         monitors = self.get_screen_resolution()
@@ -1428,62 +2162,60 @@ class TwitchLauncher:
         # Show monitors and get selection
         self.show_monitors()
         monitor_choice = Prompt.ask("[bold yellow]Select monitor number for this layout[/bold yellow]")
-        
-        try:
-            monitor_index = int(monitor_choice) - 1
-            if monitor_index < 0 or monitor_index >= len(monitors):
-                self.console.print("[bold red]Invalid monitor number.[/bold red]")
-                return False
-                
-            selected_monitor = monitors[monitor_index]
-            
-            # Get grid dimensions
-            num_windows = int(Prompt.ask("[bold yellow]How many windows for this monitor?[/bold yellow]", default="4"))
-            if num_windows <= 0:
-                self.console.print("[bold red]Number of windows must be positive.[/bold red]")
-                return False
-                
-            # Calculate grid dimensions
-            cols = max(1, round(num_windows ** 0.5))
-            rows = max(1, (num_windows + cols - 1) // cols)
-            
-            # Create layout object
-            layout_id = str(uuid.uuid4())
-            new_layout = {
-                "id": layout_id,
-                "name": layout_name,
-                "description": layout_description,
-                "monitor": selected_monitor,
-                "num_windows": num_windows,
-                "grid": {
-                    "cols": cols,
-                    "rows": rows
-                },
-                "created_at": datetime.datetime.now().isoformat()
-            }
-            
-            # Save layout
-            try:
-                layout_file = self.profiles_dir / f"layout_{layout_id}.json"
-                with open(layout_file, "w") as f:
-                    json.dump(new_layout, f, indent=2)
-                    
-                self.monitor_layouts[layout_id] = new_layout
-                self.console.print(f"[bold green]✅ Layout '{layout_name}' created successfully![/bold green]")
-                
-                # Offer to activate the new layout
-                if Confirm.ask("[bold yellow]Activate this layout now?[/bold yellow]", default=True):
-                    self.activate_layout(layout_id)
-                    
-                return True
-            except Exception as e:
-                self.console.print(f"[bold red]Error saving layout: {e}[/bold red]")
-                return False
-                
-        except ValueError:
+
+        monitor_number = _parse_int(monitor_choice)
+        if monitor_number is None:
             self.console.print("[bold red]Please enter a valid number.[/bold red]")
             return False
-            
+
+        monitor_index = monitor_number - 1
+        if monitor_index < 0 or monitor_index >= len(monitors):
+            self.console.print("[bold red]Invalid monitor number.[/bold red]")
+            return False
+
+        selected_monitor = monitors[monitor_index]
+
+        # Get grid dimensions
+        num_windows = _parse_int(Prompt.ask("[bold yellow]How many windows for this monitor?[/bold yellow]", default="4"))
+        if num_windows is None:
+            self.console.print("[bold red]Please enter a valid number.[/bold red]")
+            return False
+        if num_windows <= 0:
+            self.console.print("[bold red]Number of windows must be positive.[/bold red]")
+            return False
+
+        # Same precomputed grid shapes as calculate_grid
+        cols, rows = _GRID_BY_N.get(num_windows) or _grid(num_windows)
+
+        # Create layout object
+        layout_id = str(uuid.uuid4())
+        new_layout = {
+            "id": layout_id,
+            "name": layout_name,
+            "description": layout_description,
+            "monitor_idx": self._intern_monitor(selected_monitor),
+            "monitor_index": monitor_index,
+            "num_windows": num_windows,
+            "grid": {
+                "cols": cols,
+                "rows": rows
+            },
+            "created_at": datetime.datetime.now().isoformat()
+        }
+
+        # Record the layout; the flush to disk happens on menu return
+        self.monitor_layouts[layout_id] = new_layout
+        self._layout_order.append(layout_id)
+        self._layouts_dirty = True
+        self.console.print(f"[bold green]✅ Layout '{layout_name}' created successfully![/bold green]")
+
+        # Offer to activate the new layout
+        if Confirm.ask("[bold yellow]Activate this layout now?[/bold yellow]", default=True):
+            self.activate_layout(layout_id)
+
+        return True
+
+
     def edit_layout(self, layout_id):
         """Edit an existing monitor layout"""
         if layout_id not in self.monitor_layouts:
@@ -1509,60 +2241,65 @@ class TwitchLauncher:
             
         # Show monitors and get selection
         self.show_monitors()
-        monitor_choice = Prompt.ask("[bold yellow]Select monitor number for this layout[/bold yellow]", default=str(monitors.index(layout["monitor"]) + 1))
+        monitor_choice = Prompt.ask("[bold yellow]Select monitor number for this layout[/bold yellow]", default=str(layout.get("monitor_index", 0) + 1))
         
-        try:
-            monitor_index = int(monitor_choice) - 1
-            if monitor_index < 0 or monitor_index >= len(monitors):
-                self.console.print("[bold red]Invalid monitor number.[/bold red]")
-                return False
-                
-            selected_monitor = monitors[monitor_index]
-            
-            # Edit number of windows
-            num_windows = int(Prompt.ask("[bold yellow]How many windows for this monitor?[/bold yellow]", default=str(layout["num_windows"])))
-            if num_windows <= 0:
-                self.console.print("[bold red]Number of windows must be positive.[/bold red]")
-                return False
-                
-            # Calculate grid dimensions
-            cols = max(1, round(num_windows ** 0.5))
-            rows = max(1, (num_windows + cols - 1) // cols)
-            
-            # Update layout object
-            layout["name"] = layout_name
-            layout["description"] = layout_description
-            layout["monitor"] = selected_monitor
-            layout["num_windows"] = num_windows
-            layout["grid"] = {
-                "cols": cols,
-                "rows": rows
-            }
-            layout["updated_at"] = datetime.datetime.now().isoformat()
-            
-            # Save layout
-            try:
-                layout_file = self.profiles_dir / f"layout_{layout_id}.json"
-                with open(layout_file, "w") as f:
-                    json.dump(layout, f, indent=2)
-                    
-                self.monitor_layouts[layout_id] = layout
-                self.console.print(f"[bold green]✅ Layout '{layout_name}' updated successfully![/bold green]")
-                
-                # If this is the active layout, ask to apply changes
-                if self.active_layout == layout_id:
-                    if Confirm.ask("[bold yellow]This is the active layout. Apply changes now?[/bold yellow]", default=True):
-                        self.activate_layout(layout_id)
-                        
-                return True
-            except Exception as e:
-                self.console.print(f"[bold red]Error saving layout: {e}[/bold red]")
-                return False
-                
-        except ValueError:
+        monitor_number = _parse_int(monitor_choice)
+        if monitor_number is None:
             self.console.print("[bold red]Please enter a valid number.[/bold red]")
             return False
-            
+
+        monitor_index = monitor_number - 1
+        if monitor_index < 0 or monitor_index >= len(monitors):
+            self.console.print("[bold red]Invalid monitor number.[/bold red]")
+            return False
+
+        selected_monitor = monitors[monitor_index]
+
+        # Edit number of windows
+        num_windows = _parse_int(Prompt.ask("[bold yellow]How many windows for this monitor?[/bold yellow]", default=str(layout["num_windows"])))
+        if num_windows is None:
+            self.console.print("[bold red]Please enter a valid number.[/bold red]")
+            return False
+        if num_windows <= 0:
+            self.console.print("[bold red]Number of windows must be positive.[/bold red]")
+            return False
+
+        # Same precomputed grid shapes as calculate_grid
+        cols, rows = _GRID_BY_N.get(num_windows) or _grid(num_windows)
+
+        # Accepting every default means nothing changed; skip the
+        # update (and the updated_at stamp) so no write gets queued
+        if (layout_name, layout_description, selected_monitor, num_windows) == (
+                layout["name"], layout.get("description", ""), self._layout_monitor(layout), layout["num_windows"]):
+            self.console.print(f"[bold green]Layout '{layout_name}' unchanged.[/bold green]")
+            return True
+
+        # Update layout object
+        layout["name"] = layout_name
+        layout["description"] = layout_description
+        layout["monitor_idx"] = self._intern_monitor(selected_monitor)
+        layout["monitor_index"] = monitor_index
+        layout["num_windows"] = num_windows
+        layout["grid"] = {
+            "cols": cols,
+            "rows": rows
+        }
+        layout["updated_at"] = datetime.datetime.now().isoformat()
+
+        # Record the update; the flush to disk happens on menu return
+        self.monitor_layouts[layout_id] = layout
+        self._layouts_dirty = True
+        self.console.print(f"[bold green]✅ Layout '{layout_name}' updated successfully![/bold green]")
+
+        # If this is the active layout, ask to apply changes
+        if self.active_layout == layout_id:
+            if Confirm.ask("[bold yellow]This is the active layout. Apply changes now?[/bold yellow]", default=True):
+                # The geometry just changed, so bypass the already-active check
+                self.activate_layout(layout_id, force=True)
+
+        return True
+
+
     def delete_layout(self, layout_id):
         """Delete a monitor layout"""
         if layout_id not in self.monitor_layouts:
@@ -1575,18 +2312,17 @@ class TwitchLauncher:
             return False
             
         try:
-            # Delete layout file
-            layout_file = self.profiles_dir / f"layout_{layout_id}.json"
-            if layout_file.exists():
-                layout_file.unlink()
-                
-            # Remove from layouts dictionary
+            # Remove from the layouts dictionary and the display order;
+            # the flush to disk happens on menu return
             del self.monitor_layouts[layout_id]
+            self._layout_order.remove(layout_id)
+            self._layouts_dirty = True
             
-            # Clear active layout if it was deleted
+            # Clear active layout if it was deleted; the settings write is
+            # deferred to the layout-menu flush
             if self.active_layout == layout_id:
                 self.active_layout = None
-                self.save_settings()
+                self._settings_dirty = True
                 
             self.console.print(f"[bold green]✅ Layout '{layout['name']}' deleted successfully![/bold green]")
             return True
@@ -1601,20 +2337,29 @@ class TwitchLauncher:
             return
             
         self.console.print("\n[bold blue]Available Monitor Layouts[/bold blue]")
-        
+
+        # The menu loop re-shows this table constantly; reuse the built
+        # Table whenever the layout set hasn't changed since last render
+        sig = (tuple(self._layout_order), self.active_layout,
+               max((l.get("updated_at", "") for l in self.monitor_layouts.values()), default=""))
+        if self._layouts_table_cache is not None and self._layouts_table_cache[0] == sig:
+            self.console.print(self._layouts_table_cache[1])
+            return
+
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("#", style="cyan", justify="center")
         table.add_column("Name", style="green")
         table.add_column("Monitor", style="blue")
         table.add_column("Windows", justify="center")
         table.add_column("Description")
-        
+
+        active_layout = self.active_layout
         for i, (layout_id, layout) in enumerate(self.monitor_layouts.items(), 1):
             name = layout["name"]
-            if self.active_layout == layout_id:
+            if active_layout == layout_id:
                 name = f"[bold green]{name} (Active)[/bold green]"
-                
-            monitor = layout["monitor"]
+
+            monitor = self._layout_monitor(layout)
             monitor_info = f"{monitor['width']}x{monitor['height']} ({monitor['x']}, {monitor['y']})"
             
             table.add_row(
@@ -1624,9 +2369,10 @@ class TwitchLauncher:
                 str(layout["num_windows"]),
                 layout.get("description", "")
             )
-            
+
+        self._layouts_table_cache = (sig, table)
         self.console.print(table)
-        
+
     def select_layout(self):
         """Select and activate a monitor layout"""
         self.show_layouts()
@@ -1639,74 +2385,98 @@ class TwitchLauncher:
         if choice.lower() == 'q':
             return False
             
-        try:
-            index = int(choice) - 1
-            if index < 0 or index >= len(self.monitor_layouts):
-                self.console.print("[bold red]Invalid layout number.[/bold red]")
-                return False
-                
-            layout_id = list(self.monitor_layouts.keys())[index]
-            return self.activate_layout(layout_id)
-        except ValueError:
+        number = _parse_int(choice)
+        if number is None:
             self.console.print("[bold red]Please enter a valid number.[/bold red]")
             return False
+
+        index = number - 1
+        if index < 0 or index >= len(self._layout_order):
+            self.console.print("[bold red]Invalid layout number.[/bold red]")
+            return False
+
+        layout_id = self._layout_order[index]
+        force = False
+        if layout_id == self.active_layout:
+            force = Confirm.ask("[bold yellow]This layout is already active. Re-apply it?[/bold yellow]", default=False)
+            if not force:
+                return True
+        return self.activate_layout(layout_id, force=force)
             
-    def activate_layout(self, layout_id):
-        """Activate a monitor layout and rearrange windows"""
+    def activate_layout(self, layout_id, force=False):
+        """Activate a monitor layout and rearrange windows
+
+        Re-activating the current layout with its windows still up is a
+        no-op unless force is set (the menu forces on explicit re-apply).
+        """
         if layout_id not in self.monitor_layouts:
             self.console.print("[bold red]Layout not found.[/bold red]")
             return False
-            
+
         layout = self.monitor_layouts[layout_id]
-        
+
+        if (not force and layout_id == self.active_layout
+                and self.windows and len(self.windows) >= layout["num_windows"]):
+            self.console.print(f"[bold green]Layout '{layout['name']}' is already active.[/bold green]")
+            return True
+
         self.console.print(f"[bold green]Activating layout: {layout['name']}[/bold green]")
         
-        # Set active layout
+        # Set active layout; the settings write is deferred so a run of
+        # activations costs one flush on menu return
         self.active_layout = layout_id
-        self.save_settings()
+        self._settings_dirty = True
         
         # Rearrange windows according to layout
         return self.arrange_windows_with_layout(layout)
         
+    def _windows_alive(self, windows):
+        """Check that cached window handles still refer to live windows
+
+        One IsWindow call per handle is far cheaper than re-walking every
+        top-level window; off Windows there is no cheap liveness probe, so
+        the cache is trusted and stale handles surface as position errors.
+        """
+        if _IS_WINDOWS:
+            user32 = ctypes.windll.user32
+            return all(user32.IsWindow(win._hWnd) for win in windows)
+        return True
+
     def arrange_windows_with_layout(self, layout):
         """Arrange windows according to the specified layout"""
         try:
-            # Find Chrome windows
-            all_windows = gw.getWindowsWithTitle('')
-            self.windows = [w for w in all_windows if ('Twitch' in w.title or 'Chrome' in w.title)]
-            self.windows = self.windows[:layout["num_windows"]]  # Limit to layout's number of windows
-            
+            # Reuse the handles captured at launch; a full window walk is
+            # only needed when the cache is empty or a window has closed
+            windows = self.windows
+            if not windows or not self._windows_alive(windows):
+                windows = self._find_chrome_windows()
+            self.windows = windows[:layout["num_windows"]]  # Limit to layout's number of windows
+
             if not self.windows:
                 self.console.print("[bold red]No Chrome windows found![/bold red]")
                 return False
                 
-            # Get monitor information from layout
-            monitor = layout["monitor"]
-            cols = layout["grid"]["cols"]
-            rows = layout["grid"]["rows"]
-            
+            # Pull the monitor and grid values into locals once; the rest
+            # of the function is pure arithmetic on them
+            monitor = self._layout_monitor(layout)
+            grid = layout["grid"]
+            cols, rows = grid["cols"], grid["rows"]
+            x, y = monitor["x"], monitor["y"]
+
             # Calculate window dimensions
             win_width = monitor["width"] // cols
             win_height = monitor["height"] // rows
-            
-            # Arrange windows
-            x, y = monitor["x"], monitor["y"]
-            for i, win in enumerate(self.windows):
-                try:
-                    # Calculate position in grid
-                    col = i % cols
-                    row = i // cols
-                    
-                    # Position window
-                    win_x = x + (col * win_width)
-                    win_y = y + (row * win_height)
-                    
-                    win.moveTo(win_x, win_y)
-                    win.resizeTo(win_width, win_height)
-                    
-                except Exception as e:
-                    self.console.print(f"[bold red]Error positioning window: {e}[/bold red]")
-                    
+
+            # Walk the grid row-major once up front; zip pairs each window
+            # with its slot and drops the per-window divmod
+            positions = [(x + col * win_width, y + row * win_height)
+                         for row in range(rows) for col in range(cols)]
+            placements = [(win, win_x, win_y, win_width, win_height)
+                          for win, (win_x, win_y) in zip(self.windows, positions)]
+
+            self._position_windows(placements)
+
+
             self.console.print("[bold green]✅ Windows arranged successfully![/bold green]")
             return True
         except Exception as e: